@@ -2,6 +2,7 @@
 
 const DataService = {
   vocabulary: [],
+  wordsById: new Map(),
   metadata: {},
   loaded: false,
   useMongoDB: false,
@@ -25,6 +26,7 @@ const DataService = {
         ]);
 
         this.vocabulary = vocabs || [];
+        this._buildIndex();
         this.metadata = metadata || {};
         this.loaded = true;
 
@@ -50,6 +52,7 @@ const DataService = {
       }
       const data = await response.json();
       this.vocabulary = data.words || [];
+      this._buildIndex();
       this.metadata = data.metadata || {};
       this.loaded = true;
 
@@ -62,6 +65,11 @@ const DataService = {
     }
   },
 
+  // Build id -> word lookup so getById doesn't rescan the vocabulary
+  _buildIndex() {
+    this.wordsById = new Map(this.vocabulary.map(word => [word.id, word]));
+  },
+
   // Get all words
   getAll() {
     return this.vocabulary;
@@ -69,7 +77,7 @@ const DataService = {
 
   // Get word by ID
   getById(id) {
-    return this.vocabulary.find(word => word.id === id);
+    return this.wordsById.get(id);
   },
 
   // Get word by index
@@ -94,14 +102,14 @@ const DataService = {
 
   // Get unlearned words
   async getUnlearnedWords() {
-    const learnedIds = await StorageService.getLearnedIds();
-    return this.vocabulary.filter(word => !learnedIds.includes(word.id));
+    const learnedIds = new Set(await StorageService.getLearnedIds());
+    return this.vocabulary.filter(word => !learnedIds.has(word.id));
   },
 
   // Get learned words
   async getLearnedWords() {
-    const learnedIds = await StorageService.getLearnedIds();
-    return this.vocabulary.filter(word => learnedIds.includes(word.id));
+    const learnedIds = new Set(await StorageService.getLearnedIds());
+    return this.vocabulary.filter(word => learnedIds.has(word.id));
   },
 
   // Get words by difficulty
@@ -216,11 +224,13 @@ const DataService = {
     const learned = await StorageService.getLearnedCount();
     const unlearned = total - learned;
 
-    const byDifficulty = {
-      basic: this.getByDifficulty('basic').length,
-      intermediate: this.getByDifficulty('intermediate').length,
-      advanced: this.getByDifficulty('advanced').length
-    };
+    // Count all difficulties in one pass instead of filtering once per level
+    const byDifficulty = { basic: 0, intermediate: 0, advanced: 0 };
+    for (const word of this.vocabulary) {
+      if (word.difficulty in byDifficulty) {
+        byDifficulty[word.difficulty]++;
+      }
+    }
 
     return {
       total,
@@ -118,11 +118,12 @@ const Utils = {
   // Apply status filter
   filterByStatus(words, status, learnedIds) {
     if (status === 'all') return words;
+    const learned = new Set(learnedIds);
     if (status === 'learned') {
-      return words.filter(word => learnedIds.includes(word.id));
+      return words.filter(word => learned.has(word.id));
     }
     if (status === 'unlearned') {
-      return words.filter(word => !learnedIds.includes(word.id));
+      return words.filter(word => !learned.has(word.id));
     }
     return words;
   },